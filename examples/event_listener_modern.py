@@ -13,6 +13,7 @@ manager = Manager(
     ping_delay=10,  # Delay after start
     ping_interval=10,  # Periodically ping AMI (dead or alive)
     reconnect_timeout=2,  # Timeout reconnect if connection lost
+    reconnect_max=60,  # Upper bound of the reconnect backoff
 )
 
 
@@ -20,6 +20,27 @@ class AMIProtocol(asyncio.Protocol):
 
     def send(self, data, as_list=False):
         encoding = getattr(self, 'encoding', 'ascii')
+        data = self._register(data, as_list)
+        try:
+            self.transport.write(str(data).encode(encoding))
+        except Exception:  # pragma: no cover
+            self.log.exception('Fail to send %r' % data)
+        return data
+
+    def send_batch(self, actions):
+        """Send several :class:`~panoramisk.actions.Action` with a single
+        write. Each action keeps its own ``as_list``"""
+        encoding = getattr(self, 'encoding', 'ascii')
+        actions = [self._register(action, getattr(action, 'as_list', False))
+                   for action in actions]
+        try:
+            self.transport.writelines(
+                [str(action).encode(encoding) for action in actions])
+        except Exception:  # pragma: no cover
+            self.log.exception('Fail to send %r' % actions)
+        return actions
+
+    def _register(self, data, as_list):
         if not isinstance(data, actions.Action):
             if 'Command' in data:
                 klass = actions.Command
@@ -30,10 +51,6 @@ class AMIProtocol(asyncio.Protocol):
         self.responses[data.id] = data
         if data.action_id:
             self.responses[data.action_id] = data
-        try:
-            self.transport.write(str(data).encode(encoding))
-        except Exception:  # pragma: no cover
-            self.log.exception('Fail to send %r' % data)
         return data
 
     def data_received(self, data):
@@ -84,7 +101,7 @@ class AMIProtocol(asyncio.Protocol):
         elif 'event' in message:
             if message['event'].lower() == 'shutdown':
                 self.connection_lost(message)
-            self.factory.dispatch(message)
+            self.factory.post(message)
 
     def connection_lost(self, exc):
         if not self.closed:
@@ -1,14 +1,40 @@
 import asyncio
 import logging
-from collections import defaultdict
 from collections import deque
+import functools
+import random
 import re
 import fnmatch
+import types
 from .ami_protocol import AMIProtocol
 from . import actions
 from . import utils
 
 
+def _has_wildcard(pattern):
+    return any(c in pattern for c in '*?[')
+
+
+@functools.lru_cache(maxsize=512)
+def _translate(pattern):
+    return fnmatch.translate(pattern)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_patterns(patterns):
+    """Compile a tuple of fnmatch patterns into a single regexp.
+
+    Each pattern is wrapped in an optional lookahead followed by an empty
+    group named after its position (``p0``, ``p1``, ...) so one ``match()``
+    call reports every matching pattern, not only the first alternative.
+    Results are cached so managers registering the same patterns share the
+    compiled regexp.
+    """
+    return re.compile(''.join(
+        '(?:(?=%s)(?P<p%d>))?' % (_translate(pattern), i)
+        for i, pattern in enumerate(patterns)))
+
+
 class Manager:
     """Main object:
 
@@ -30,9 +56,13 @@ class Manager:
         ping_delay=10,
         ping_interval=10,
         reconnect_timeout=2,
+        reconnect_max=60,
+        reconnect_jitter=0.5,
         protocol_factory=AMIProtocol,
         save_stream=None,
         loop=None,
+        use_uvloop=False,
+        eager_tasks=False,
         forgetable_actions=('ping', 'login'),
     )
 
@@ -40,19 +70,35 @@ class Manager:
         self.config = dict(self.defaults, **config)
         self.loop = self.config['loop']
         self.log = config.get('log', logging.getLogger(__name__))
-        self.callbacks = defaultdict(list)
+        if utils.to_bool(self.config['use_uvloop']):
+            try:
+                import uvloop
+            except ImportError:
+                self.log.warning('uvloop is not installed. Using the default event loop')
+            else:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         self.protocol = None
-        self.patterns = []
+        self._literals = {}
+        self._wildcards = {}
+        self._matcher = None
+        self._groups = None
+        self._pending_events = deque()
+        self._dispatch_scheduled = False
         self.save_stream = self.config.get('save_stream')
         self.authenticated = False
         self.authenticated_future = None
         self.awaiting_actions = deque()
         self.forgetable_actions = self.config['forgetable_actions']
         self.pinger = None
+        self._ping_due = None
         self.ping_delay = int(self.config['ping_delay'])
         self.ping_interval = int(self.config['ping_interval'])
         self.reconnect_timeout = int(self.config['reconnect_timeout'])
+        self.reconnect_max = int(self.config['reconnect_max'])
+        self.reconnect_jitter = min(max(float(self.config['reconnect_jitter']), 0.), 1.)
+        self._reconnect_attempts = 0
         self._connected = False
+        self._loop_configured = False
         self.register_event('FullyBooted', self.send_awaiting_actions)
         self.on_login = config.get('on_login', on_login)
         self.on_connect = config.get('on_connect', on_connect)
@@ -69,9 +115,10 @@ class Manager:
                 self._connected = False
             else:
                 self.log.warning('Not able to reconnect')
-            self.loop.call_later(self.reconnect_timeout, self.connect)
+            self.loop.call_later(self.reconnect_delay(), self.connect)
         else:
             self._connected = True
+            self._reconnect_attempts = 0
             self.log.debug('Manager connected')
             self.loop.call_soon(self.on_connect, self)
             self.protocol = protocol
@@ -91,7 +138,7 @@ class Manager:
                 self.authenticated_future.add_done_callback(self.login)
             else:
                 self.log.debug('username not in config file')
-            self.pinger = self.loop.call_later(self.ping_delay, self.ping)
+            self._delay_ping()
 
     def login(self, future):
         self.authenticated_future = None
@@ -99,22 +146,36 @@ class Manager:
         self.authenticated = bool(resp.success)
         if self.authenticated:
             self.loop.call_soon(self.on_login, self)
-        if self.pinger is not None:
-            self.pinger.cancel()
-        self.pinger = self.loop.call_later(self.ping_delay, self.ping)
+        self._delay_ping()
         return self.authenticated
 
-    def ping(self):  # pragma: no cover
-        self.pinger = self.loop.call_later(self.ping_interval, self.ping)
-        self.protocol.send({'Action': 'Ping'})
+    def _delay_ping(self):
+        """Postpone the next ping to ``ping_delay`` seconds from now.
+
+        The pending timer is kept: :meth:`ping` notices the new due time when
+        it fires and reschedules itself.
+        """
+        self._ping_due = self.loop.time() + self.ping_delay
+        if self.pinger is None:
+            self.pinger = self.loop.call_at(self._ping_due, self.ping)
+
+    def ping(self):
+        now = self.loop.time()
+        if now >= self._ping_due:
+            self._ping_due = now + self.ping_interval
+            self.protocol.send({'Action': 'Ping'})
+        self.pinger = self.loop.call_at(self._ping_due, self.ping)
 
     async def send_awaiting_actions(self, *_):
         self.log.info('Sending awaiting actions')
+        batch = []
         while self.awaiting_actions:
             action = self.awaiting_actions.popleft()
             if action['action'].lower() not in self.forgetable_actions:
                 if not action.done():
-                    self.send_action(action, as_list=action.as_list)
+                    batch.append(action)
+        if batch:
+            self.protocol.send_batch(batch)
 
     def send_action(self, action, as_list=None, **kwargs):
         """Send an :class:`~panoramisk.actions.Action` to the server:
@@ -194,6 +255,7 @@ class Manager:
         """connect to the server"""
         if self.loop is None:  # pragma: no cover
             self.loop = asyncio.get_event_loop()
+        self._configure_loop()
         t = asyncio.ensure_future(
             self.loop.create_connection(
                 self.config['protocol_factory'],
@@ -206,6 +268,17 @@ class Manager:
             self.run_forever(on_startup, on_shutdown)
         return t
 
+    def _configure_loop(self):
+        if self._loop_configured:
+            return
+        self._loop_configured = True
+        # Coroutine callbacks that finish without awaiting anything run to
+        # completion right away instead of being scheduled (python 3.12+)
+        if (utils.to_bool(self.config['eager_tasks']) and
+                hasattr(asyncio, 'eager_task_factory') and
+                self.loop.get_task_factory() is None):
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+
     def run_forever(self, on_startup, on_shutdown):
         """Start loop forever"""
         try:
@@ -238,30 +311,113 @@ class Manager:
             >>> @manager.register_event('Meetme*')
             ... def callback(manager, event):
             ...     print(manager, event)
+
+        Patterns are matched against event names without regard to case.
         """
         def _register_event(callback):
-            if not self.callbacks[pattern]:
-                self.patterns.append((pattern,
-                                     re.compile(fnmatch.translate(pattern))))
-            self.callbacks[pattern].append(callback)
+            key = pattern.casefold()
+            entries = self._wildcards if _has_wildcard(key) else self._literals
+            entry = entries.get(key)
+            if entry is None:
+                entries[key] = (pattern, [callback])
+                if entries is self._wildcards:
+                    self._matcher = None
+            else:
+                entry[1].append(callback)
             return callback
         if callback is not None:
             return _register_event(callback)
         else:
             return _register_event
 
+    def unregister_event(self, pattern, callback):
+        """Remove a callback registered with :meth:`register_event`:
+
+        .. code-block:: python
+
+            >>> manager = Manager()
+            >>> def callback(manager, event):
+            ...     print(manager, event)
+            >>> manager.register_event('Meetme*', callback)
+            <function callback at 0x...>
+            >>> manager.unregister_event('Meetme*', callback)
+
+        Raise :class:`ValueError` if the callback is not registered for this
+        pattern. Callbacks must not be unregistered while an event is being
+        dispatched.
+        """
+        key = pattern.casefold()
+        entries = self._wildcards if _has_wildcard(key) else self._literals
+        entry = entries.get(key)
+        if entry is None or callback not in entry[1]:
+            raise ValueError('%r is not registered for %r' % (callback, pattern))
+        entry[1].remove(callback)
+        if not entry[1]:
+            del entries[key]
+            if entries is self._wildcards:
+                self._matcher = None
+
+    def post(self, event):
+        """Queue an event to be dispatched on the next loop iteration.
+
+        Events received in a burst are dispatched together by a single
+        callback instead of one :meth:`dispatch` call per ``data_received``.
+        """
+        self._pending_events.append(event)
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            self.loop.call_soon(self._dispatch_pending)
+
+    def _dispatch_pending(self):
+        pending = self._pending_events
+        dispatch = self.dispatch
+        try:
+            while pending:
+                dispatch(pending.popleft())
+        finally:
+            self._dispatch_scheduled = False
+            if pending:
+                # a callback raised: keep the remaining events going
+                self._dispatch_scheduled = True
+                self.loop.call_soon(self._dispatch_pending)
+
     def dispatch(self, event):
         matches = []
         event.manager = self
-        for pattern, regexp in self.patterns:
-            match = regexp.match(event.event)
-            if match is not None:
-                matches.append(pattern)
-                for callback in self.callbacks[pattern]:
-                    ret = callback(self, event)
-                    if (asyncio.iscoroutine(ret) or
-                            isinstance(ret, asyncio.Future)):
-                        asyncio.ensure_future(ret, loop=self.loop)
+        key = event.event.casefold()
+        # Callbacks may register new ones while we dispatch. Recording each
+        # list's length now avoids copying it: callbacks appended during this
+        # dispatch only see the next event. Unregistering is not supported.
+        entries = []
+        entry = self._literals.get(key)
+        if entry is not None:
+            entries.append((entry[0], entry[1], len(entry[1])))
+        if self._wildcards:
+            if self._matcher is None:
+                self._matcher = _compile_patterns(tuple(self._wildcards))
+                self._groups = [('p%d' % i, entry)
+                                for i, entry in enumerate(self._wildcards.values())]
+            groups = self._matcher.match(key).groupdict()
+            for name, (pattern, callbacks) in self._groups:
+                if groups[name] is not None:
+                    entries.append((pattern, callbacks, len(callbacks)))
+        if not entries:
+            return matches
+
+        coroutine_type = types.CoroutineType
+        iscoroutine = asyncio.iscoroutine
+        if self.loop is not None:
+            create_task = self.loop.create_task
+        else:  # pragma: no cover
+            create_task = asyncio.ensure_future
+        for pattern, callbacks, count in entries:
+            matches.append(pattern)
+            for i in range(count):
+                ret = callbacks[i](self, event)
+                # Futures are already scheduled: only coroutines need a task
+                if ret is not None and (type(ret) is coroutine_type or
+                                        iscoroutine(ret)):
+                    create_task(ret)
         return matches
 
     def close(self):
@@ -279,8 +435,24 @@ class Manager:
         if self.pinger:
             self.pinger.cancel()
             self.pinger = None
-        self.log.info('Try to connect again in %d second(s)' % self.reconnect_timeout)
-        self.loop.call_later(self.reconnect_timeout, self.connect)
+        delay = self.reconnect_delay()
+        self.log.info('Try to connect again in %.1f second(s)' % delay)
+        self.loop.call_later(delay, self.connect)
+
+    def reconnect_delay(self):
+        """Return the delay before the next reconnection attempt.
+
+        The delay starts at ``reconnect_timeout`` and doubles on each failed
+        attempt, up to ``reconnect_max`` seconds. It is then reduced by a
+        random fraction of at most ``reconnect_jitter`` (between 0 and 1) so
+        that many managers losing the same server don't all reconnect at once.
+        """
+        delay = self.reconnect_timeout * 2 ** self._reconnect_attempts
+        if delay < self.reconnect_max:
+            self._reconnect_attempts += 1
+        else:
+            delay = self.reconnect_max
+        return delay * (1 - self.reconnect_jitter * random.random())
 
     @classmethod
     def from_config(cls, filename_or_fd, section='asterisk', **kwargs):
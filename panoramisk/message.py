@@ -1,7 +1,19 @@
+import sys
 from urllib.parse import unquote, unquote_plus
 
 from . import utils
 
+_BODY_PREFIXES = ("Response: Follows", "Response: Fail", "Event: ReceivedSMS")
+
+# Header keys seen in most messages, spelled as Asterisk sends them, mapped to
+# the (lowercased, key) pair stored by CaseInsensitiveDict. Both strings are
+# interned so all messages share them. Keys keep their wire spelling.
+_KNOWN_KEYS = {k: (sys.intern(k.lower()), sys.intern(k)) for k in (
+    "Event", "Response", "ActionID", "CommandID", "CommandId", "ChanVariable",
+    "Channel", "Uniqueid", "UniqueID", "Linkedid", "LinkedID", "Privilege",
+    "Message", "Result", "SubEvent", "Command", "Variable", "Value", "Context",
+    "Application", "AppData", "Priority", "Extension", "Exten", "Status")}
+
 
 class Message(utils.CaseInsensitiveDict):
     """Handle both Responses and Events with the same api:
@@ -37,11 +49,17 @@ class Message(utils.CaseInsensitiveDict):
 
     """
 
-    quoted_keys = ["result"]
-    success_responses = ["Success", "Follows", "Goodbye"]
+    quoted_keys = frozenset(["result"])
+    success_responses = frozenset(["Success", "Follows", "Goodbye"])
 
     def __init__(self, headers, content=""):
         super(Message, self).__init__(headers, content=content)
+        self._setup()
+
+    def _setup(self):
+        """Set instance attributes. Called by both :meth:`__init__` and
+        :meth:`from_line`, which does not go through ``__init__``: subclasses
+        should extend this rather than ``__init__``"""
         self.manager = None
 
     @property
@@ -73,18 +91,23 @@ class Message(utils.CaseInsensitiveDict):
         """
         if "event" in self:
             return True
-        if self.response in self.success_responses:
-            return True
-        return False
+        response = self.response
+        # a repeated Response header is parsed as a list, which is unhashable
+        return isinstance(response, str) and response in self.success_responses
 
     def __repr__(self):
-        message = " ".join(["%s=%r" % i for i in sorted(self.items())])
-        return "<Message {0}>".format(message)
+        return "<Message " + " ".join(f"{k}={v!r}" for k, v in self.items()) + ">"
 
     def iter_lines(self):
         """Iter over response body"""
-        for line in self.content.split("\n"):
-            yield line
+        content = self.content
+        start = 0
+        end = content.find("\n")
+        while end != -1:
+            yield content[start:end]
+            start = end + 1
+            end = content.find("\n", start)
+        yield content[start:]
 
     def parsed_result(self):
         """Get parsed result of AGI command"""
@@ -114,21 +137,31 @@ class Message(utils.CaseInsensitiveDict):
             raise TypeError("{0} must be a list. got {1}".format(key, values))
         result = utils.CaseInsensitiveDict()
         for item in values:
-            k, v = item.split("=", 1)
+            k, sep, v = item.partition("=")
+            if not sep:
+                raise ValueError("{0} is not a key=value pair".format(item))
             result[k] = v
         return result
 
+    @classmethod
+    def _from_parsed(cls, store, content=""):
+        """Build a message from a ``{lowercased key: (key, value)}`` dict,
+        as built by :meth:`from_line`, without normalizing keys again"""
+        message = cls.__new__(cls)
+        store["content"] = ("content", content)
+        message._store = store
+        message._setup()
+        return message
+
     @classmethod
     def from_line(cls, line):
         mlines = line.split(utils.EOL)
-        headers = {}
+        store = {}
         content = ""
-        has_body = ("Response: Follows", "Response: Fail", "Event: ReceivedSMS")
-        if mlines[0].startswith(has_body):
+        if mlines[0].startswith(_BODY_PREFIXES):
             if mlines[0] == "Event: ReceivedSMS":
                 mlines.pop()
-                content = mlines.pop()
-                _, content = content.split(": ", 1)
+                _, _, content = mlines.pop().partition(": ")
                 content = unquote_plus(content)
                 if content.startswith("\ufeff"):
                     content = content[1:]
@@ -136,18 +169,25 @@ class Message(utils.CaseInsensitiveDict):
                 content = mlines.pop()
             while not content and mlines:
                 content = mlines.pop()
+        quoted_keys = cls.quoted_keys
         for mline in mlines:
-            if ": " in mline:
-                k, v = mline.split(": ", 1)
-                if k.lower() in cls.quoted_keys:
-                    v = unquote(v).strip()
-                if k in headers:
-                    o = headers.setdefault(k, [])
-                    if not isinstance(o, list):
-                        o = [o]
-                    o.append(v)
-                    headers[k] = o
-                else:
-                    headers[k] = v
-        if "Event" in headers or "Response" in headers:
-            return cls(headers, content)
+            k, sep, v = mline.partition(": ")
+            if not sep:
+                continue
+            known = _KNOWN_KEYS.get(k)
+            if known is not None:
+                lk, k = known
+            else:
+                lk = k.lower()
+            if lk in quoted_keys:
+                v = unquote(v).strip()
+            # repeated headers keep the case of their first occurrence
+            prev = store.get(lk)
+            if prev is None:
+                store[lk] = (k, v)
+            elif type(prev[1]) is list:
+                prev[1].append(v)
+            else:
+                store[lk] = (prev[0], [prev[1], v])
+        if "event" in store or "response" in store:
+            return cls._from_parsed(store, content)
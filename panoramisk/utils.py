@@ -197,6 +197,23 @@ class CaseInsensitiveDict(MutableMapping):
         return str(dict(self.items()))
 
 
+def to_bool(value):
+    """Convert a config value to a boolean. Strings are parsed like
+    :meth:`configparser.ConfigParser.getboolean` does:
+
+    .. code-block:: python
+
+        >>> to_bool('no'), to_bool('On'), to_bool(True), to_bool(0)
+        (False, True, True, False)
+    """
+    if isinstance(value, str):
+        try:
+            return ConfigParser.BOOLEAN_STATES[value.lower()]
+        except KeyError:
+            raise ValueError('Not a boolean: %s' % value)
+    return bool(value)
+
+
 def config(filename_or_fd, section='asterisk'):
     config = ConfigParser()
     if hasattr(filename_or_fd, 'read'):
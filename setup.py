@@ -49,6 +49,7 @@ setup(
     tests_require=test_requires,
     extras_require={
         'test': test_requires,
+        'uvloop': ['uvloop'],
     },
     entry_points='''
     [console_scripts]
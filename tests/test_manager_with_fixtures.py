@@ -4,6 +4,7 @@ import pytest
 import asyncio
 from panoramisk import testing
 from panoramisk import message
+from panoramisk import actions
 
 test_dir = os.path.join(os.path.dirname(__file__), 'fixtures')
 
@@ -127,6 +128,108 @@ def test_events(manager):
     assert matches == []
 
 
+def test_events_multiple_patterns(manager):
+    manager = manager()
+    received = []
+
+    def callback(manager, event):
+        received.append(event)
+
+    manager.register_event('Peer*', callback)
+    manager.register_event('*Status', callback)
+    manager.register_event('Hangup', callback)
+
+    event = message.Message.from_line('Event: PeerStatus')
+    assert manager.dispatch(event) == ['Peer*', '*Status']
+    assert received == [event, event]
+
+    event = message.Message.from_line('Event: Hangup')
+    assert manager.dispatch(event) == ['Hangup']
+
+    event = message.Message.from_line('Event: HangupRequest')
+    assert manager.dispatch(event) == []
+
+
+def test_unregister_event(manager):
+    manager = manager()
+    received = []
+
+    def callback(manager, event):
+        received.append(event)
+
+    manager.register_event('Peer*', callback)
+    manager.register_event('PeerStatus', callback)
+    event = message.Message.from_line('Event: PeerStatus')
+    assert manager.dispatch(event) == ['PeerStatus', 'Peer*']
+
+    manager.unregister_event('peer*', callback)
+    assert manager.dispatch(event) == ['PeerStatus']
+    manager.unregister_event('PeerStatus', callback)
+    assert manager.dispatch(event) == []
+    assert len(received) == 3
+
+    with pytest.raises(ValueError):
+        manager.unregister_event('PeerStatus', callback)
+
+
+def test_register_event_during_dispatch(manager):
+    manager = manager()
+    received = []
+
+    def late(manager, event):
+        received.append('late')
+
+    def callback(manager, event):
+        received.append('callback')
+        manager.register_event('PeerStatus', late)
+
+    manager.register_event('PeerStatus', callback)
+    event = message.Message.from_line('Event: PeerStatus')
+    manager.dispatch(event)
+    assert received == ['callback']
+    manager.dispatch(event)
+    assert received == ['callback', 'callback', 'late']
+
+
+def test_register_wildcard_event_during_dispatch(manager):
+    manager = manager()
+    received = []
+
+    def late(manager, event):
+        received.append('late')
+
+    def first(manager, event):
+        received.append('first')
+        manager.register_event('Peer*', late)
+
+    manager.register_event('PeerStatus', first)
+    manager.register_event('Peer*', lambda manager, event: received.append('wild'))
+    event = message.Message.from_line('Event: PeerStatus')
+    manager.dispatch(event)
+    assert received == ['first', 'wild']
+    manager.dispatch(event)
+    assert received == ['first', 'wild', 'first', 'wild', 'late']
+
+
+def test_events_case_insensitive(manager):
+    manager = manager()
+    received = []
+
+    def callback(manager, event):
+        received.append(event)
+
+    manager.register_event('peer*', callback)
+    manager.register_event('NEWCHANNEL', callback)
+    manager.register_event('NewChannel', callback)
+
+    event = message.Message.from_line('Event: PeerStatus')
+    assert manager.dispatch(event) == ['peer*']
+
+    event = message.Message.from_line('Event: Newchannel')
+    assert manager.dispatch(event) == ['NEWCHANNEL']
+    assert len(received) == 3
+
+
 def test_coroutine_events_handler(manager):
     async def callback(manager, event):
         # to create quickly a coroutine generator, don't do that on
@@ -143,6 +246,41 @@ def test_coroutine_events_handler(manager):
     assert matches == ['Peer*']
 
 
+@pytest.mark.asyncio
+async def test_send_awaiting_actions(manager):
+    manager = manager()
+    status = actions.Action({'Action': 'Status'}, as_list=True)
+    ping = actions.Action({'Action': 'Ping'})
+    queue = actions.Action({'Action': 'QueueStatus'})
+    manager.awaiting_actions.extend([status, ping, queue])
+    transport = manager.protocol.transport
+    await manager.send_awaiting_actions()
+    assert not manager.awaiting_actions
+    transport.writelines.assert_called_once_with(
+        [str(status).encode('utf8'), str(queue).encode('utf8')])
+    assert manager.protocol.responses[status.id] is status
+    assert status.as_list is True
+    assert ping.id not in manager.protocol.responses
+
+
+@pytest.mark.asyncio
+async def test_events_handler_return_values(manager):
+    manager = manager()
+    future = manager.loop.create_future()
+    received = []
+
+    async def coroutine(manager, event):
+        received.append(event)
+
+    manager.register_event('Peer*', coroutine)
+    manager.register_event('Peer*', lambda manager, event: future)
+    event = message.Message.from_line('Event: PeerStatus')
+    assert manager.dispatch(event) == ['Peer*']
+    await asyncio.sleep(0)
+    assert received == [event]
+    assert not future.done()
+
+
 def test_from_config(event_loop, tmpdir):
     f = tmpdir.mkdir("config").join("config.ini")
     f.write('''
@@ -164,3 +302,113 @@ def test_pinger(manager):
     assert isinstance(manager.pinger, asyncio.TimerHandle)
     manager.close()
     assert manager.pinger is None
+
+
+def test_ping_due_time(manager):
+    manager = manager(ping_delay=10, ping_interval=5)
+    manager.close()
+    with testing.patch.object(manager.loop, 'time', return_value=100), \
+            testing.patch.object(manager.protocol, 'send') as send:
+        manager._delay_ping()
+        assert manager._ping_due == 110
+
+        manager.loop.time.return_value = 105
+        manager.ping()
+        assert not send.called
+        assert manager.pinger.when() == 110
+
+        manager.loop.time.return_value = 110
+        manager.ping()
+        send.assert_called_once_with({'Action': 'Ping'})
+        assert manager._ping_due == 115
+        assert manager.pinger.when() == 115
+    manager.close()
+
+
+@pytest.mark.asyncio
+async def test_pinger_not_rescheduled_on_login(manager):
+    manager = manager(username='xx', secret='xx', stream='login_ok.yaml')
+    pinger = manager.pinger
+    due = manager._ping_due
+    await manager.authenticated_future
+    manager.login(manager.authenticated_future)
+    assert manager.pinger is pinger
+    assert manager._ping_due >= due
+    manager.close()
+
+
+def test_use_uvloop_not_installed(manager, caplog):
+    policy = asyncio.get_event_loop_policy()
+    with testing.patch.dict('sys.modules', {'uvloop': None}):
+        manager(use_uvloop=True)
+    assert asyncio.get_event_loop_policy() is policy
+    assert 'uvloop is not installed' in caplog.text
+
+
+@pytest.mark.skipif(not hasattr(asyncio, 'eager_task_factory'),
+                    reason='requires python 3.12+')
+def test_eager_tasks(manager):
+    manager = manager(eager_tasks=True)
+    manager._configure_loop()
+    try:
+        assert manager.loop.get_task_factory() is asyncio.eager_task_factory
+    finally:
+        manager.loop.set_task_factory(None)
+
+
+@pytest.mark.skipif(not hasattr(asyncio, 'eager_task_factory'),
+                    reason='requires python 3.12+')
+def test_eager_tasks_keep_existing_factory(manager):
+    manager = manager(eager_tasks=True)
+
+    def factory(loop, coro, **kwargs):  # pragma: no cover
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    manager.loop.set_task_factory(factory)
+    try:
+        manager._configure_loop()
+        assert manager.loop.get_task_factory() is factory
+    finally:
+        manager.loop.set_task_factory(None)
+
+
+def test_reconnect_delay(manager):
+    m = manager(reconnect_timeout=2, reconnect_max=10)
+    with testing.patch('random.random', return_value=1):
+        assert [m.reconnect_delay() for i in range(5)] == [1, 2, 4, 5, 5]
+    m = manager(reconnect_timeout=2, reconnect_jitter=0)
+    assert [m.reconnect_delay() for i in range(3)] == [2, 4, 8]
+    m = manager(reconnect_timeout=2, reconnect_max=10, reconnect_jitter=1.5)
+    assert m.reconnect_jitter == 1
+    with testing.patch('random.random', return_value=0.9):
+        delays = [m.reconnect_delay() for i in range(100)]
+    assert min(delays) > 0
+    assert m._reconnect_attempts == 3
+
+
+def test_matcher_shared_between_managers(manager):
+    managers = [manager(), manager()]
+    for m in managers:
+        m.register_event('Peer*', lambda *args: None)
+        m.register_event('Agent*', lambda *args: None)
+        m.dispatch(message.Message.from_line('Event: PeerStatus'))
+    assert managers[0]._matcher is managers[1]._matcher
+
+
+def test_use_uvloop_from_config(event_loop, tmpdir, caplog):
+    f = tmpdir.mkdir("config").join("config.ini")
+    f.write('[asterisk]\nuse_uvloop = false\n')
+    policy = asyncio.get_event_loop_policy()
+    with testing.patch.dict('sys.modules', {'uvloop': None}):
+        testing.Manager.from_config(str(f), loop=event_loop)
+    assert asyncio.get_event_loop_policy() is policy
+    assert 'uvloop' not in caplog.text
+
+
+def test_eager_tasks_from_config(event_loop, tmpdir):
+    f = tmpdir.mkdir("config").join("config.ini")
+    f.write('[asterisk]\neager_tasks = no\n')
+    manager = testing.Manager.from_config(str(f), loop=event_loop)
+    with testing.patch.object(asyncio, 'eager_task_factory', create=True):
+        manager._configure_loop()
+    assert manager.loop.get_task_factory() is None
@@ -21,6 +21,14 @@ Value: Y
 ''')
     assert m.value == ['X', 'Y']
 
+    m = message('''
+Event: X
+Value: X
+Value: Y
+Value: Z
+''')
+    assert m.value == ['X', 'Y', 'Z']
+
 
 def test_content(message):
     m = message('''\
@@ -28,3 +36,81 @@ Response: Follows
 --- blah ---
 ''')
     assert m.content == '--- blah ---'
+
+
+def test_quoted_result(message):
+    m = message('''\
+Response: Success
+Result: 200%20result=1%20
+''')
+    assert m.result == '200 result=1'
+
+
+def test_received_sms(message):
+    m = message('''\
+Event: ReceivedSMS
+Message: Hello%20world
+--END SMS EVENT--''')
+    assert m.content == 'Hello world'
+
+
+def test_known_keys_are_shared(message):
+    m1 = message('Event: X\nUniqueid: 1\nActionId: 1')
+    m2 = message('Event: Y\nUniqueid: 2\nUniqueID: 3')
+    assert list(m1) == ['Event', 'Uniqueid', 'ActionId', 'content']
+    assert list(m1)[1] is list(m2)[1]
+    assert m2.uniqueid == ['2', '3']
+
+
+def test_iter_lines():
+    for content in ('', 'a', 'a\nb', 'a\n\nb\n'):
+        m = Message({'Response': 'Follows'}, content)
+        assert list(m.iter_lines()) == content.split('\n')
+
+
+def test_getdict():
+    m = Message({'Event': 'X', 'ChanVariable': ['A=1', 'B=x=y', 'C=']})
+    assert dict(m.getdict('chanvariable')) == {'A': '1', 'B': 'x=y', 'C': ''}
+    m = Message({'Event': 'X', 'ChanVariable': ['A=1', 'B']})
+    with pytest.raises(ValueError):
+        m.getdict('chanvariable')
+    with pytest.raises(TypeError):
+        m.getdict('event')
+
+
+def test_from_line_messages_are_independent(message):
+    m1 = message('Event: X\nValue: 1\nValue: 2')
+    assert message('Foo: bar') is None
+    m2 = message('Response: Success\nValue: 3')
+    assert m1.value == ['1', '2']
+    assert m2.value == '3'
+    assert 'event' not in m2
+
+
+def test_from_line_same_as_constructor(message):
+    m = message('Response: Follows\nActionID: 1\n'
+                'value: a\nVALUE: b\nValue: c\n\nbody')
+    expected = Message({'Response': 'Follows', 'ActionID': '1',
+                        'value': ['a', 'b', 'c']}, 'body')
+    assert list(m) == ['Response', 'ActionID', 'value', 'content']
+    assert dict(m) == dict(expected)
+    assert m.value == ['a', 'b', 'c']
+    assert m.content == 'body'
+    assert m.manager is None
+
+
+def test_success_with_repeated_response(message):
+    m = message('Response: Success\nResponse: Success')
+    assert m.success is False
+
+
+def test_from_line_subclass_setup(message):
+    class MyMessage(Message):
+        def _setup(self):
+            super()._setup()
+            self.seen = True
+
+    m = MyMessage.from_line('Event: X')
+    assert m.seen is True
+    assert m.manager is None
+    assert MyMessage({'Event': 'X'}).seen is True
@@ -24,3 +24,15 @@ def test_received(conn):
 
 def test_send(conn):
     assert isinstance(conn.send({}), asyncio.Future)
+
+
+def test_events_dispatched_in_batch(conn):
+    manager = conn.factory
+    received = []
+    manager.register_event('Peer*', lambda manager, event: received.append(event))
+    conn.data_received(b'Event: PeerStatus\nPeer: gawel\n\n'
+                       b'Event: PeerStatus\nPeer: bob\n\n')
+    assert received == []
+    manager.loop.run_until_complete(asyncio.sleep(0))
+    assert [e.peer for e in received] == ['gawel', 'bob']
+    assert not manager._dispatch_scheduled